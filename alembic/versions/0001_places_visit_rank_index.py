@@ -0,0 +1,32 @@
+"""Index places by visit rank
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+
+Tables are created by init_db (create_all), which never alters a table
+that already exists, so the revisions in this directory bring existing
+databases up to the models. Every step is idempotent, so they are also
+safe to run against a database freshly built by create_all.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_places_visit_rank
+            ON places (visit_count DESC, last_visit_at DESC)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_places_visit_rank")
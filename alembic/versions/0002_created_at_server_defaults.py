@@ -0,0 +1,29 @@
+"""Default created_at to now() on the server
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+
+The models no longer stamp created_at in Python, so existing tables need
+the column default for ORM inserts, multi-row INSERT and COPY alike.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+TABLES = ("location_data", "places", "visits", "movements", "checkins")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT now()")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at DROP DEFAULT")
@@ -0,0 +1,44 @@
+"""Add PostGIS geography points with GIST indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+
+geo is a stored generated column, so adding it rewrites the table; on a
+large location_data this takes a while and holds an exclusive lock.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+GEO_POINT_SQL = "ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography"
+
+TABLES = ("places", "location_data")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+
+    for table in TABLES:
+        op.execute(
+            f"""
+            ALTER TABLE {table} ADD COLUMN IF NOT EXISTS geo geography(Point, 4326)
+                GENERATED ALWAYS AS ({GEO_POINT_SQL}) STORED
+            """
+        )
+        op.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_geo ON {table} USING gist (geo)")
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_coords")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_coords ON {table} (latitude, longitude)"
+        )
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_geo")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS geo")
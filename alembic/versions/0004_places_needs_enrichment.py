@@ -0,0 +1,38 @@
+"""Precompute places.needs_enrichment with a partial index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+
+scripts/enrich_places.py filters on needs_enrichment, so this revision
+must be applied before running it against an existing database.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE places ADD COLUMN IF NOT EXISTS needs_enrichment boolean
+            GENERATED ALWAYS AS (name IS NULL OR name = '' OR name LIKE 'Place at%') STORED
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_places_needs_enrichment
+            ON places (visit_count DESC, last_visit_at DESC)
+            WHERE needs_enrichment
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_places_needs_enrichment")
+    op.execute("ALTER TABLE places DROP COLUMN IF EXISTS needs_enrichment")
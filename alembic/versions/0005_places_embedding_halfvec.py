@@ -0,0 +1,54 @@
+"""Store place embeddings as halfvec(384) with an HNSW index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+
+Place.semantic_search binds its query as halfvec, which has no distance
+operator against a vector(384) column, so existing databases need the
+column converted and idx_places_embedding rebuilt with halfvec_cosine_ops.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# Index build settings (transaction-local)
+BUILD_SETTINGS = (
+    "SET LOCAL maintenance_work_mem = '2GB'",
+    "SET LOCAL max_parallel_maintenance_workers = 7",
+)
+
+
+def _build_embedding_index(opclass: str) -> None:
+    for setting in BUILD_SETTINGS:
+        op.execute(setting)
+    op.execute(
+        f"""
+        CREATE INDEX idx_places_embedding ON places
+            USING hnsw (embedding {opclass})
+            WITH (m = 24, ef_construction = 128)
+        """
+    )
+
+
+def upgrade() -> None:
+    # halfvec needs pgvector >= 0.7
+    op.execute("ALTER EXTENSION vector UPDATE")
+    op.execute("DROP INDEX IF EXISTS idx_places_embedding")
+    op.execute(
+        "ALTER TABLE places ALTER COLUMN embedding TYPE halfvec(384) USING embedding::halfvec(384)"
+    )
+    _build_embedding_index("halfvec_cosine_ops")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_places_embedding")
+    op.execute(
+        "ALTER TABLE places ALTER COLUMN embedding TYPE vector(384) USING embedding::vector(384)"
+    )
+    _build_embedding_index("vector_cosine_ops")
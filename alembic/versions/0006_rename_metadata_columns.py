@@ -0,0 +1,47 @@
+"""Rename metadata columns to place_metadata / visit_metadata
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15
+
+"metadata" is reserved on declarative models, so the columns are renamed to
+match the model attributes. Each rename only runs while the old column
+exists, so databases that already have the new names are left as they are.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+RENAMES = (("places", "place_metadata"), ("visits", "visit_metadata"))
+
+RENAME_COLUMN_SQL = """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = '{table}' AND column_name = '{old}'
+        ) AND NOT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = '{table}' AND column_name = '{new}'
+        ) THEN
+            ALTER TABLE {table} RENAME COLUMN {old} TO {new};
+        END IF;
+    END $$
+"""
+
+
+def upgrade() -> None:
+    for table, column in RENAMES:
+        op.execute(RENAME_COLUMN_SQL.format(table=table, old="metadata", new=column))
+
+
+def downgrade() -> None:
+    for table, column in RENAMES:
+        op.execute(RENAME_COLUMN_SQL.format(table=table, old=column, new="metadata"))
@@ -6,12 +6,17 @@ Main FastAPI application for location intelligence data warehouse and analytics.
 """
 
 import logging
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.routers import health, places, visits, movements, location_data, analysis
 from database.connection import init_db
+from database.pool import create_pool
+from database.cache import create_redis
+from core.analysis.place_index import PlaceIndex
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +26,24 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info("🚀 Starting Location Intelligence Service...")
 
-    # Initialize database
-    init_db()
-    logger.info("✅ Database initialized")
+    # Initialize database (skipped in workers when the launcher already did it)
+    if os.getenv("INIT_DB", "1") == "1":
+        init_db()
+        logger.info("✅ Database initialized")
+
+    # Async connection pool for request handlers
+    app.state.pool = await create_pool()
+    app.state.redis = create_redis()
+
+    # In-memory spatial index for /places/nearby
+    app.state.place_index = await PlaceIndex.load(app.state.pool)
 
     yield
 
     # Cleanup
     logger.info("👋 Shutting down Location Intelligence Service...")
+    await app.state.pool.close()
+    await app.state.redis.aclose()
 
 
 # Create FastAPI application
@@ -39,15 +54,23 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+# CORS middleware (scoped to the known frontend origins; requests without an
+# Origin header, such as health monitors, pass straight through)
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:8003").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Single-user system, adjust as needed
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "X-API-Key"],
 )
 
 # Include routers
@@ -73,4 +96,23 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=True)
+    if os.getenv("API_RELOAD", "").lower() in ("1", "true"):
+        # Development: auto-reload (single process, default event loop)
+        uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # Each worker runs the lifespan and opens its own asyncpg pool (up to 20
+        # connections), so size API_WORKERS against Postgres max_connections
+        workers = int(os.getenv("API_WORKERS", "1"))
+        if workers > 1:
+            # Create tables once here rather than racing create_all in every worker
+            init_db()
+            os.environ["INIT_DB"] = "0"
+
+        uvicorn.run(
+            "api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=workers,
+        )
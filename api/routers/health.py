@@ -6,22 +6,46 @@ Health check and status endpoints.
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from database.connection import get_db
+import asyncpg
+import orjson
+import random
+import redis.asyncio as redis
+from database.pool import get_pool
+from database.cache import get_redis
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# All status statistics in a single round trip. Row counts are the planner's
+# estimates from pg_class (kept current by autovacuum/ANALYZE) so the query cost
+# doesn't grow with table size; MIN/MAX(timestamp) use the timestamp btree index.
+STATUS_QUERY = """
+    SELECT
+        (SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = 'location_data'::regclass) AS locations,
+        (SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = 'places'::regclass) AS places,
+        (SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = 'visits'::regclass) AS visits,
+        (SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = 'movements'::regclass) AS movements,
+        (SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = 'checkins'::regclass) AS checkins,
+        (SELECT MIN(timestamp) FROM location_data) AS earliest,
+        (SELECT MAX(timestamp) FROM location_data) AS latest
+"""
+
+# /status is polled by monitors; serve it from Redis for ~20s (jittered ±5s)
+STATUS_CACHE_KEY = "status:v1"
+STATUS_CACHE_TTL_MS = 20_000
+STATUS_CACHE_JITTER_MS = 5_000
+
 router = APIRouter()
 
 
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(pool: asyncpg.Pool = Depends(get_pool)):
     """Health check endpoint"""
     try:
         # Test database connection
-        db.execute("SELECT 1")
+        async with pool.acquire() as conn:
+            await conn.execute("SELECT 1")
 
         return {
             "status": "healthy",
@@ -41,46 +65,36 @@ async def health_check(db: Session = Depends(get_db)):
 
 
 @router.get("/status")
-async def get_status(db: Session = Depends(get_db)):
-    """Get service status with statistics"""
+async def get_status(
+    pool: asyncpg.Pool = Depends(get_pool),
+    cache: redis.Redis = Depends(get_redis),
+):
+    """Get service status with statistics (row counts are planner estimates)"""
     try:
-        from database.models import LocationData, Place, Visit, Movement, Checkin
-
-        # Get counts
-        location_count = db.query(LocationData).count()
-        place_count = db.query(Place).count()
-        visit_count = db.query(Visit).count()
-        movement_count = db.query(Movement).count()
-        checkin_count = db.query(Checkin).count()
+        cached = await cache.get(STATUS_CACHE_KEY)
+        if cached:
+            return orjson.loads(cached)
+    except Exception as e:
+        logger.warning(f"Status cache read failed: {e}")
 
-        # Get date ranges
-        earliest_location = (
-            db.query(LocationData).order_by(LocationData.timestamp).first()
-        )
-        latest_location = (
-            db.query(LocationData).order_by(LocationData.timestamp.desc()).first()
-        )
+    try:
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(STATUS_QUERY)
 
-        return {
+        status = {
             "status": "operational",
             "service": "location-intelligence",
             "version": "1.0.0",
             "statistics": {
-                "total_gps_points": location_count,
-                "total_places": place_count,
-                "total_visits": visit_count,
-                "total_movements": movement_count,
-                "total_checkins": checkin_count,
+                "total_gps_points": row["locations"],
+                "total_places": row["places"],
+                "total_visits": row["visits"],
+                "total_movements": row["movements"],
+                "total_checkins": row["checkins"],
             },
             "date_range": {
-                "earliest": (
-                    earliest_location.timestamp.isoformat()
-                    if earliest_location
-                    else None
-                ),
-                "latest": (
-                    latest_location.timestamp.isoformat() if latest_location else None
-                ),
+                "earliest": row["earliest"].isoformat() if row["earliest"] else None,
+                "latest": row["latest"].isoformat() if row["latest"] else None,
             },
             "timestamp": datetime.utcnow().isoformat(),
         }
@@ -92,3 +106,11 @@ async def get_status(db: Session = Depends(get_db)):
             "error": str(e),
             "timestamp": datetime.utcnow().isoformat(),
         }
+
+    try:
+        ttl_ms = STATUS_CACHE_TTL_MS + random.randint(-STATUS_CACHE_JITTER_MS, STATUS_CACHE_JITTER_MS)
+        await cache.set(STATUS_CACHE_KEY, orjson.dumps(status), px=ttl_ms)
+    except Exception as e:
+        logger.warning(f"Status cache write failed: {e}")
+
+    return status
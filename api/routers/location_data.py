@@ -5,13 +5,33 @@ File: api/routers/location_data.py
 API endpoints for GPS data management and ingestion.
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
 from pydantic import BaseModel
 from datetime import datetime
+import asyncpg
+import orjson
+
+from database.pool import get_pool
 
 router = APIRouter()
 
+LOCATION_POINTS_QUERY = """
+    SELECT id::text AS id,
+           timestamp,
+           latitude,
+           longitude,
+           accuracy,
+           speed,
+           course
+    FROM location_data
+    WHERE ($1::timestamptz IS NULL OR timestamp >= $1)
+      AND ($2::timestamptz IS NULL OR timestamp < $2)
+    ORDER BY timestamp
+    LIMIT $3 OFFSET $4
+"""
+
 
 class LocationPointResponse(BaseModel):
     """Location point response model"""
@@ -38,19 +58,31 @@ class IngestionResponse(BaseModel):
     message: str
 
 
-@router.get("/location-data/points", response_model=List[LocationPointResponse])
+@router.get("/location-data/points", response_class=StreamingResponse)
 async def get_location_points(
     start_time: Optional[datetime] = None,
     end_time: Optional[datetime] = None,
     limit: int = Query(1000, ge=1, le=10000),
     offset: int = Query(0, ge=0),
+    pool: asyncpg.Pool = Depends(get_pool),
 ):
     """
     Query raw GPS points by time range.
 
-    TODO: Implement actual database query
+    Streams newline-delimited JSON (one LocationPointResponse object per line)
+    from a server-side cursor, so memory stays flat and the first point is
+    sent as soon as it is read.
     """
-    return []
+    async def stream_points():
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                cursor = conn.cursor(
+                    LOCATION_POINTS_QUERY, start_time, end_time, limit, offset, prefetch=500
+                )
+                async for row in cursor:
+                    yield orjson.dumps(dict(row)) + b"\n"
+
+    return StreamingResponse(stream_points(), media_type="application/x-ndjson")
 
 
 @router.post("/location-data/ingest", response_model=IngestionResponse)
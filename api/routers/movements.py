@@ -5,13 +5,33 @@ File: api/routers/movements.py
 API endpoints for movement tracking between visits.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
+import asyncpg
+
+from database.pool import get_pool
 
 router = APIRouter()
 
+LIST_MOVEMENTS_QUERY = """
+    SELECT id::text AS id,
+           start_visit_id::text AS start_visit_id,
+           end_visit_id::text AS end_visit_id,
+           start_time,
+           end_time,
+           distance_meters,
+           duration_minutes,
+           avg_speed_ms,
+           movement_type
+    FROM movements
+    WHERE ($1::timestamptz IS NULL OR start_time >= $1)
+      AND ($2::timestamptz IS NULL OR start_time < $2)
+    ORDER BY start_time DESC
+    LIMIT $3 OFFSET $4
+"""
+
 
 class MovementResponse(BaseModel):
     """Movement response model"""
@@ -28,17 +48,18 @@ class MovementResponse(BaseModel):
 
 @router.get("/movements", response_model=List[MovementResponse])
 async def list_movements(
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    pool: asyncpg.Pool = Depends(get_pool),
 ):
     """
     List movements with optional date range filtering.
-
-    TODO: Implement actual database query
     """
-    return []
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(LIST_MOVEMENTS_QUERY, start_date, end_date, limit, offset)
+    return [dict(row) for row in rows]
 
 
 @router.get("/movements/{movement_id}", response_model=MovementResponse)
@@ -5,12 +5,45 @@ File: api/routers/places.py
 API endpoints for place management.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List, Optional
 from pydantic import BaseModel
+import asyncpg
+
+from core.analysis.place_index import PlaceIndex
+from database.pool import get_pool
 
 router = APIRouter()
 
+LIST_PLACES_QUERY = """
+    SELECT id::text AS id,
+           name,
+           latitude,
+           longitude,
+           place_type,
+           COALESCE(visit_count, 0) AS visit_count
+    FROM places
+    WHERE ($1::text IS NULL OR place_type = $1)
+    ORDER BY places.visit_count DESC, places.last_visit_at DESC, places.id
+    LIMIT $2 OFFSET $3
+"""
+
+PLACES_BY_ID_QUERY = """
+    SELECT id::text AS id,
+           name,
+           latitude,
+           longitude,
+           place_type,
+           COALESCE(visit_count, 0) AS visit_count
+    FROM places
+    WHERE id = ANY($1::uuid[])
+"""
+
+
+def get_place_index(request: Request) -> PlaceIndex:
+    """Get the application's in-memory place index (built in the lifespan)"""
+    return request.app.state.place_index
+
 
 class PlaceResponse(BaseModel):
     """Place response model"""
@@ -27,23 +60,14 @@ async def list_places(
     limit: int = Query(50, ge=1, le=1000),
     offset: int = Query(0, ge=0),
     place_type: Optional[str] = None,
+    pool: asyncpg.Pool = Depends(get_pool),
 ):
     """
     List all places with optional filtering.
-
-    TODO: Implement actual database query
     """
-    return []
-
-
-@router.get("/places/{place_id}", response_model=PlaceResponse)
-async def get_place(place_id: str):
-    """
-    Get place by ID.
-
-    TODO: Implement actual database query
-    """
-    raise HTTPException(status_code=404, detail="Place not found")
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(LIST_PLACES_QUERY, place_type, limit, offset)
+    return [dict(row) for row in rows]
 
 
 @router.get("/places/search", response_model=List[PlaceResponse])
@@ -65,10 +89,32 @@ async def get_nearby_places(
     longitude: float = Query(..., ge=-180, le=180),
     radius_meters: int = Query(1000, ge=1, le=50000),
     limit: int = Query(10, ge=1, le=100),
+    place_index: PlaceIndex = Depends(get_place_index),
+    pool: asyncpg.Pool = Depends(get_pool),
 ):
     """
     Find places near coordinates.
 
-    TODO: Implement spatial query
+    Candidates come from the in-memory place index (nearest first); their
+    rows are then fetched in one query by id.
     """
-    return []
+    nearest = place_index.query_radius(latitude, longitude, radius_meters, limit)
+    if not nearest:
+        return []
+
+    ids = [place_id for place_id, _ in nearest]
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(PLACES_BY_ID_QUERY, ids)
+
+    by_id = {row["id"]: dict(row) for row in rows}
+    return [by_id[place_id] for place_id in ids if place_id in by_id]
+
+
+@router.get("/places/{place_id}", response_model=PlaceResponse)
+async def get_place(place_id: str):
+    """
+    Get place by ID.
+
+    TODO: Implement actual database query
+    """
+    raise HTTPException(status_code=404, detail="Place not found")
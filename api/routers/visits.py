@@ -5,13 +5,35 @@ File: api/routers/visits.py
 API endpoints for visit timeline management.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
+from uuid import UUID
 from pydantic import BaseModel
 from datetime import datetime
+import asyncpg
+
+from database.pool import get_pool
 
 router = APIRouter()
 
+LIST_VISITS_QUERY = """
+    SELECT v.id::text AS id,
+           COALESCE(v.place_id::text, '') AS place_id,
+           COALESCE(p.name, '') AS place_name,
+           v.arrival_time,
+           v.departure_time,
+           v.duration_minutes,
+           COALESCE(v.is_ongoing, false) AS is_ongoing,
+           COALESCE(v.confidence_score, 0.8) AS confidence_score
+    FROM visits v
+    LEFT JOIN places p ON p.id = v.place_id
+    WHERE ($1::timestamptz IS NULL OR v.arrival_time >= $1)
+      AND ($2::timestamptz IS NULL OR v.arrival_time < $2)
+      AND ($3::uuid IS NULL OR v.place_id = $3)
+    ORDER BY v.arrival_time DESC
+    LIMIT $4 OFFSET $5
+"""
+
 
 class VisitResponse(BaseModel):
     """Visit response model"""
@@ -27,18 +49,22 @@ class VisitResponse(BaseModel):
 
 @router.get("/visits", response_model=List[VisitResponse])
 async def list_visits(
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    place_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    place_id: Optional[UUID] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    pool: asyncpg.Pool = Depends(get_pool),
 ):
     """
     List visits with optional date range and place filtering.
 
-    TODO: Implement actual database query
+    Rows are read with a single asyncpg fetch and returned as plain dicts,
+    which FastAPI validates once against the response model.
     """
-    return []
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(LIST_VISITS_QUERY, start_date, end_date, place_id, limit, offset)
+    return [dict(row) for row in rows]
 
 
 @router.get("/visits/{visit_id}", response_model=VisitResponse)
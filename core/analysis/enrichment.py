@@ -6,17 +6,72 @@ Cost-optimized reverse geocoding for place names and addresses.
 Uses caching and proximity checks to minimize API calls.
 """
 
+import asyncio
+import atexit
 import logging
-import json
+import math
+import os
+import random
+import sqlite3
 import time
 from pathlib import Path
-from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
-from geopy.geocoders import Nominatim
-from geopy.distance import geodesic
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict
+import httpx
+import numpy as np
+import orjson
+import redis
+import redis.asyncio as aioredis
+from numba import njit
+from sklearn.neighbors import BallTree
 
 logger = logging.getLogger("myndy.enrichment")
 
+EARTH_RADIUS_M = 6371000.0
+NOMINATIM_URL = "https://nominatim.openstreetmap.org"
+USER_AGENT = "myndy-location-intelligence/1.0"
+
+# Connection pool shared by all API requests; transient connect failures are retried
+HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+HTTP_RETRIES = 3
+
+# Shared Redis cache of geocoding results (reverse geocodes rarely change)
+REDIS_KEY_PREFIX = "enrich:v1:"
+REDIS_TTL_SECONDS = 30 * 86400
+REDIS_TTL_JITTER_SECONDS = 3 * 86400
+
+# Uniform grid for nearby cache probes: 0.001° cells (~111m of latitude)
+GRID_CELL_DEG = 0.001
+GRID_CELL_M = EARTH_RADIUS_M * math.radians(GRID_CELL_DEG)
+
+# Full-range lookups use a BallTree over a frozen prefix of the cached points;
+# points added since are scanned linearly until this many accumulate
+TREE_REBUILD_TAIL = 100
+
+# Address components checked by _classify_place_type, highest priority first
+PLACE_TYPE_PRIORITY = ('amenity', 'shop', 'building', 'highway')
+RESIDENTIAL_BUILDINGS = frozenset({'house', 'residential', 'apartments'})
+
+
+@njit('i8(f8,f8,f8[:,::1],f8)', fastmath=True, cache=True)
+def _first_within(lat, lng, coords, radius_m):
+    """
+    Index of the first point in coords within radius_m of (lat, lng), or -1
+
+    coords rows are (lat, lng, cos(lat)) with angles in radians, so the
+    per-point cosine is precomputed at insert time. Compares the haversine
+    term directly against the threshold for radius_m (no asin/sqrt per point).
+    """
+    max_a = math.sin(radius_m / (2.0 * EARTH_RADIUS_M)) ** 2
+    cos_lat = math.cos(lat)
+    for i in range(coords.shape[0]):
+        dlat = coords[i, 0] - lat
+        dlng = coords[i, 1] - lng
+        a = math.sin(dlat * 0.5) ** 2 + cos_lat * coords[i, 2] * math.sin(dlng * 0.5) ** 2
+        if a <= max_a:
+            return i
+    return -1
+
 
 @dataclass
 class PlaceEnrichment:
@@ -36,9 +91,11 @@ class PlaceEnricher:
     Cost-optimized place enrichment via reverse geocoding
 
     Features:
-    - Local JSON cache to avoid duplicate API calls
+    - Local SQLite cache to avoid duplicate API calls (one row write per new place)
+    - Optional shared Redis cache (REDIS_URL) across processes and restarts
     - Proximity checking (uses cached data for nearby places)
     - Rate limiting (1 request per second for Nominatim)
+    - Async batch enrichment that only awaits the API for cache misses
     - Configurable max requests per run
     """
 
@@ -47,76 +104,200 @@ class PlaceEnricher:
         Initialize place enricher
 
         Args:
-            cache_file: Path to JSON cache file
+            cache_file: Cache path; the SQLite database lives alongside it with a .db suffix
+                (an existing JSON cache at this path is imported on first use)
             cache_radius: Distance in meters to consider places as "same location" for caching
         """
         self.cache_file = Path(cache_file)
+        self.db_file = self.cache_file.with_suffix('.db')
         self.cache_radius = cache_radius
         self.cache: Dict[str, PlaceEnrichment] = {}
-        self.geocoder = Nominatim(user_agent="myndy-location-intelligence/1.0")
         self.last_request_time = 0
         self.min_request_interval = 1.0  # seconds (Nominatim rate limit)
 
+        # Shared cache (disabled when REDIS_URL is not set)
+        self._redis_url = os.getenv("REDIS_URL")
+        self._redis: Optional[redis.Redis] = (
+            redis.Redis.from_url(self._redis_url) if self._redis_url else None
+        )
+        # Async client for the event-loop path (created on first use inside the running loop)
+        self._aredis: Optional[aioredis.Redis] = None
+
+        # Persistent API client (keep-alive + HTTP/2, so TLS is negotiated once)
+        self._http = httpx.Client(
+            base_url=NOMINATIM_URL,
+            headers={"User-Agent": USER_AGENT},
+            timeout=10,
+            transport=httpx.HTTPTransport(http2=True, limits=HTTP_LIMITS, retries=HTTP_RETRIES),
+        )
+
+        # Async API client (created on first use inside the running loop)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._request_lock = asyncio.Semaphore(1)
+        self._next_request_at = 0.0
+
+        # Cached coordinates as (lat, lng, cos(lat)) rows in radians and their cache keys,
+        # kept in sync with the cache, plus a grid of cell -> row indices for nearby probes
+        self._keys: List[str] = []
+        self._cache_coords = np.empty((0, 3), dtype=np.float64)
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+
+        # BallTree over the first _tree_count rows (see _find_cached_nearby)
+        self._tree: Optional[BallTree] = None
+        self._tree_count = 0
+
+        # Cache writes are committed in batches (see _store)
+        self._pending_writes = 0
+        self.flush_every = 50
+
         # Load existing cache
+        self._conn = self._connect()
         self.load_cache()
+        atexit.register(self.flush)
 
-        logger.info(f"Initialized PlaceEnricher with cache at {self.cache_file}")
+        logger.info(f"Initialized PlaceEnricher with cache at {self.db_file}")
         logger.info(f"Cache contains {len(self.cache)} entries")
 
+    def _connect(self):
+        """Open the SQLite cache database and create its schema if needed"""
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS enrichments (
+                lat REAL NOT NULL,
+                lng REAL NOT NULL,
+                json TEXT NOT NULL,
+                PRIMARY KEY (lat, lng)
+            )
+        """)
+        conn.commit()
+        return conn
+
     def load_cache(self):
-        """Load enrichment cache from JSON file"""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r') as f:
-                    data = json.load(f)
-                    # Convert dict back to PlaceEnrichment objects
-                    self.cache = {
-                        key: PlaceEnrichment(**value)
-                        for key, value in data.items()
-                    }
-                logger.info(f"Loaded {len(self.cache)} cached enrichments")
-            except Exception as e:
-                logger.warning(f"Failed to load cache: {e}")
-                self.cache = {}
-        else:
-            self.cache = {}
-
-    def save_cache(self):
-        """Save enrichment cache to JSON file"""
+        """Load enrichment cache from SQLite (importing a legacy JSON cache once)"""
+        try:
+            rows = self._conn.execute("SELECT lat, lng, json FROM enrichments").fetchall()
+            if not rows and self.cache_file.exists():
+                self._import_json_cache()
+                rows = self._conn.execute("SELECT lat, lng, json FROM enrichments").fetchall()
+
+            cache = {}
+            keys = []
+            coords = []
+            for lat, lng, value in rows:
+                cache_key = self._get_cache_key(lat, lng)
+                cache[cache_key] = PlaceEnrichment(**orjson.loads(value))
+                keys.append(cache_key)
+                coords.append((lat, lng))
+        except Exception as e:
+            logger.warning(f"Failed to load cache: {e}")
+            cache, keys, coords = {}, [], []
+
+        # Coordinates come straight from the lat/lng columns, so keys are never re-parsed
+        self.cache = cache
+        self._keys = keys
+        self._cache_coords = self._to_rows(np.asarray(coords, dtype=np.float64).reshape(-1, 2))
+        self._grid = {}
+        for idx, (lat, lng) in enumerate(coords):
+            self._grid.setdefault(self._grid_cell(lat, lng), []).append(idx)
+        self._tree = None
+        self._tree_count = 0
+        logger.info(f"Loaded {len(self.cache)} cached enrichments")
+
+    def _import_json_cache(self):
+        """One-time import of the legacy JSON cache file into SQLite"""
+        data = orjson.loads(self.cache_file.read_bytes())
+
+        rows = []
+        for key, value in data.items():
+            cache_lat, cache_lng = map(float, key.split(','))
+            rows.append((cache_lat, cache_lng, orjson.dumps(value).decode()))
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO enrichments (lat, lng, json) VALUES (?, ?, ?)",
+                rows,
+            )
+        logger.info(f"Imported {len(rows)} enrichments from {self.cache_file}")
+
+    def _store(self, latitude: float, longitude: float, enrichment: PlaceEnrichment):
+        """
+        Insert or replace a single enrichment in the SQLite cache
+
+        Writes accumulate in one transaction that is committed every
+        flush_every inserts, by flush(), and at interpreter exit.
+        """
         try:
-            # Ensure directory exists
-            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # Convert PlaceEnrichment objects to dicts
-            data = {
-                key: {
-                    'name': value.name,
-                    'address': value.address,
-                    'city': value.city,
-                    'state': value.state,
-                    'country': value.country,
-                    'postal_code': value.postal_code,
-                    'place_type': value.place_type,
-                    'raw_data': value.raw_data
-                }
-                for key, value in self.cache.items()
-            }
-
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
-
-            logger.info(f"Saved {len(self.cache)} enrichments to cache")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO enrichments (lat, lng, json) VALUES (?, ?, ?)",
+                (round(latitude, 4), round(longitude, 4), orjson.dumps(asdict(enrichment)).decode()),
+            )
+            self._pending_writes += 1
+            if self._pending_writes >= self.flush_every:
+                self.flush()
         except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
+            logger.error(f"Failed to save enrichment to cache: {e}")
+
+    def flush(self):
+        """Commit pending cache writes (call at the end of a batch)"""
+        if self._pending_writes:
+            self._conn.commit()
+            logger.info(f"Saved {self._pending_writes} enrichments to cache")
+            self._pending_writes = 0
+
+    def close(self):
+        """Flush pending writes and close the SQLite, HTTP and Redis connections"""
+        self.flush()
+        atexit.unregister(self.flush)
+        self._conn.close()
+        self._http.close()
+        if self._redis is not None:
+            self._redis.close()
 
     def _get_cache_key(self, latitude: float, longitude: float) -> str:
         """Generate cache key for coordinates (rounded to ~11m precision)"""
         return f"{latitude:.4f},{longitude:.4f}"
 
+    @staticmethod
+    def _to_rows(coords: np.ndarray) -> np.ndarray:
+        """Convert (N, 2) lat/lng degrees into contiguous (lat, lng, cos(lat)) radian rows"""
+        rows = np.empty((len(coords), 3), dtype=np.float64)
+        rows[:, :2] = np.radians(coords)
+        rows[:, 2] = np.cos(rows[:, 0])
+        return rows
+
+    @staticmethod
+    def _grid_cell(latitude: float, longitude: float) -> Tuple[int, int]:
+        """Grid cell (integer multiples of GRID_CELL_DEG) containing a coordinate"""
+        return round(latitude / GRID_CELL_DEG), round(longitude / GRID_CELL_DEG)
+
+    def _index_add(self, cache_key: str, latitude: float, longitude: float):
+        """Append a newly cached point to the coordinate array and grid (amortized O(1))"""
+        count = len(self._keys)
+        if count == len(self._cache_coords):
+            grown = np.empty((max(64, 2 * count), 3), dtype=np.float64)
+            grown[:count] = self._cache_coords[:count]
+            self._cache_coords = grown
+
+        lat_rad = math.radians(latitude)
+        self._cache_coords[count] = (lat_rad, math.radians(longitude), math.cos(lat_rad))
+        self._keys.append(cache_key)
+        self._grid.setdefault(self._grid_cell(latitude, longitude), []).append(count)
+
     def _find_cached_nearby(self, latitude: float, longitude: float) -> Optional[PlaceEnrichment]:
         """
         Check if there's a cached place within cache_radius
 
+        Probes the 3x3 block of grid cells around the point first. That block
+        reaches at least one cell width past the point in every direction, so
+        the full lookup only runs when cache_radius exceeds that (high
+        latitudes or large radii). The full lookup queries a haversine
+        BallTree over a frozen prefix of the cached points and scans the
+        rest with the compiled kernel; the tree is rebuilt once that tail
+        exceeds TREE_REBUILD_TAIL points.
+
         Args:
             latitude: Place latitude
             longitude: Place longitude
@@ -124,19 +305,271 @@ class PlaceEnricher:
         Returns:
             PlaceEnrichment if found nearby, None otherwise
         """
-        for cache_key, enrichment in self.cache.items():
-            try:
-                cache_lat, cache_lng = map(float, cache_key.split(','))
-                distance = geodesic((latitude, longitude), (cache_lat, cache_lng)).meters
+        count = len(self._keys)
+        if count == 0:
+            return None
 
-                if distance <= self.cache_radius:
-                    logger.debug(f"Found cached place within {distance:.0f}m")
-                    return enrichment
-            except Exception:
-                continue
+        lat1 = math.radians(latitude)
+        lng1 = math.radians(longitude)
+        max_a = math.sin(self.cache_radius / (2.0 * EARTH_RADIUS_M)) ** 2
+        cos_lat = math.cos(lat1)
+
+        cell_lat, cell_lng = self._grid_cell(latitude, longitude)
+        for dlat_cell in (-1, 0, 1):
+            for dlng_cell in (-1, 0, 1):
+                for idx in self._grid.get((cell_lat + dlat_cell, cell_lng + dlng_cell), ()):
+                    lat2, lng2, cos_lat2 = self._cache_coords[idx]
+                    a = (
+                        math.sin((lat2 - lat1) * 0.5) ** 2
+                        + cos_lat * cos_lat2 * math.sin((lng2 - lng1) * 0.5) ** 2
+                    )
+                    if a <= max_a:
+                        logger.debug(f"Found cached place within {self.cache_radius:.0f}m (grid)")
+                        return self.cache[self._keys[idx]]
+
+        probe_reach_m = GRID_CELL_M * math.cos(math.radians(min(abs(latitude) + GRID_CELL_DEG, 90.0)))
+        if self.cache_radius <= probe_reach_m and abs(longitude) + GRID_CELL_DEG < 180.0:
+            return None
+
+        if count - self._tree_count > TREE_REBUILD_TAIL:
+            self._tree = BallTree(self._cache_coords[:count, :2], metric='haversine')
+            self._tree_count = count
+
+        if self._tree is not None:
+            dist, ind = self._tree.query([[lat1, lng1]], k=1)
+            if dist[0, 0] * EARTH_RADIUS_M <= self.cache_radius:
+                logger.debug(f"Found cached place within {self.cache_radius:.0f}m (tree)")
+                return self.cache[self._keys[ind[0, 0]]]
+
+        idx = _first_within(
+            lat1, lng1, self._cache_coords[self._tree_count:count], self.cache_radius
+        )
+        if idx < 0:
+            return None
+
+        logger.debug(f"Found cached place within {self.cache_radius:.0f}m")
+        return self.cache[self._keys[self._tree_count + idx]]
+
+    def _get_cached(
+        self, latitude: float, longitude: float, shared: bool = True
+    ) -> Optional[PlaceEnrichment]:
+        """
+        Look up a place in the cache
+
+        Checks the local cache (exact key first, then within cache_radius),
+        then the shared Redis cache for the exact key.
+
+        Args:
+            latitude: Place latitude
+            longitude: Place longitude
+            shared: If False, skip the Redis lookup (e.g. after prefetch)
+
+        Returns:
+            Cached PlaceEnrichment or None on a cache miss
+        """
+        cache_key = self._get_cache_key(latitude, longitude)
+
+        # Exact cache match
+        if cache_key in self.cache:
+            logger.debug(f"Cache hit (exact): {cache_key}")
+            return self.cache[cache_key]
+
+        # Nearby cache match
+        nearby = self._find_cached_nearby(latitude, longitude)
+        if nearby:
+            logger.debug(f"Cache hit (nearby): {cache_key}")
+            # Store in cache at this location too
+            self._add_to_cache(latitude, longitude, nearby)
+            return nearby
+
+        # Shared cache match
+        if not shared:
+            return None
+        enrichment = self._get_shared(cache_key)
+        if enrichment:
+            logger.debug(f"Cache hit (shared): {cache_key}")
+            self._add_to_cache(latitude, longitude, enrichment)
+            return enrichment
 
         return None
 
+    def _get_shared(self, cache_key: str) -> Optional[PlaceEnrichment]:
+        """Fetch an enrichment from the shared Redis cache (None on miss or error)"""
+        if self._redis is None:
+            return None
+
+        try:
+            value = self._redis.get(REDIS_KEY_PREFIX + cache_key)
+        except redis.RedisError as e:
+            logger.warning(f"Shared cache read failed: {e}")
+            return None
+
+        return PlaceEnrichment(**orjson.loads(value)) if value else None
+
+    def prefetch(self, points: List[Tuple[float, float]]) -> int:
+        """
+        Seed the local cache from the shared Redis cache in one round-trip
+
+        Keys already held locally are skipped; the rest are fetched with a
+        single MGET instead of one GET per point.
+
+        Args:
+            points: List of (latitude, longitude) tuples
+
+        Returns:
+            Number of enrichments loaded from the shared cache
+        """
+        if self._redis is None:
+            return 0
+
+        wanted = self._prefetch_wanted(points)
+        if not wanted:
+            return 0
+
+        try:
+            values = self._redis.mget([REDIS_KEY_PREFIX + key for key in wanted])
+        except redis.RedisError as e:
+            logger.warning(f"Shared cache prefetch failed: {e}")
+            return 0
+
+        return self._apply_prefetched(wanted, values)
+
+    async def prefetch_async(self, points: List[Tuple[float, float]]) -> int:
+        """Async variant of prefetch (one MGET on the async Redis client)"""
+        client = self._async_redis()
+        if client is None:
+            return 0
+
+        wanted = self._prefetch_wanted(points)
+        if not wanted:
+            return 0
+
+        try:
+            values = await client.mget([REDIS_KEY_PREFIX + key for key in wanted])
+        except redis.RedisError as e:
+            logger.warning(f"Shared cache prefetch failed: {e}")
+            return 0
+
+        return self._apply_prefetched(wanted, values)
+
+    def _prefetch_wanted(self, points: List[Tuple[float, float]]) -> Dict[str, Tuple[float, float]]:
+        """Cache keys (with a representative point) not yet held in the local cache"""
+        wanted: Dict[str, Tuple[float, float]] = {}
+        for latitude, longitude in points:
+            cache_key = self._get_cache_key(latitude, longitude)
+            if cache_key not in self.cache:
+                wanted.setdefault(cache_key, (latitude, longitude))
+        return wanted
+
+    def _apply_prefetched(self, wanted: Dict[str, Tuple[float, float]], values: List) -> int:
+        """Add MGET results to the local cache, returning how many were hits"""
+        loaded = 0
+        for (latitude, longitude), value in zip(wanted.values(), values):
+            if value:
+                self._add_to_cache(latitude, longitude, PlaceEnrichment(**orjson.loads(value)))
+                loaded += 1
+
+        logger.debug(f"Prefetched {loaded}/{len(wanted)} enrichments from shared cache")
+        return loaded
+
+    def _set_shared(self, cache_key: str, enrichment: PlaceEnrichment):
+        """Write an enrichment to the shared Redis cache with a jittered TTL"""
+        if self._redis is None:
+            return
+
+        try:
+            self._redis.set(
+                REDIS_KEY_PREFIX + cache_key, orjson.dumps(asdict(enrichment)), ex=self._shared_ttl()
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Shared cache write failed: {e}")
+
+    @staticmethod
+    def _shared_ttl() -> int:
+        """Shared cache TTL, jittered so entries written together don't expire together"""
+        return REDIS_TTL_SECONDS + random.randint(-REDIS_TTL_JITTER_SECONDS, REDIS_TTL_JITTER_SECONDS)
+
+    def _async_redis(self) -> Optional[aioredis.Redis]:
+        """Async Redis client for the running loop (None when REDIS_URL is not set)"""
+        if self._aredis is None and self._redis_url:
+            self._aredis = aioredis.Redis.from_url(self._redis_url)
+        return self._aredis
+
+    async def _get_shared_async(self, cache_key: str) -> Optional[PlaceEnrichment]:
+        """Async variant of _get_shared (does not block the event loop)"""
+        client = self._async_redis()
+        if client is None:
+            return None
+
+        try:
+            value = await client.get(REDIS_KEY_PREFIX + cache_key)
+        except redis.RedisError as e:
+            logger.warning(f"Shared cache read failed: {e}")
+            return None
+
+        return PlaceEnrichment(**orjson.loads(value)) if value else None
+
+    async def _set_shared_async(self, cache_key: str, enrichment: PlaceEnrichment):
+        """Async variant of _set_shared (does not block the event loop)"""
+        client = self._async_redis()
+        if client is None:
+            return
+
+        try:
+            await client.set(
+                REDIS_KEY_PREFIX + cache_key, orjson.dumps(asdict(enrichment)), ex=self._shared_ttl()
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Shared cache write failed: {e}")
+
+    def _parse_result(self, raw: Dict) -> PlaceEnrichment:
+        """Build a PlaceEnrichment from a raw Nominatim reverse geocoding result"""
+        address = raw.get('address', {})
+
+        # Get place name - prioritize actual place names over addresses
+        place_name = raw.get('name', '')
+        if not place_name or place_name.isdigit():
+            # Fallback: check for business/poi name in address
+            place_name = (
+                address.get('amenity') or
+                address.get('shop') or
+                address.get('building') or
+                address.get('tourism') or
+                raw.get('display_name', '').split(',')[0]
+            )
+
+        return PlaceEnrichment(
+            name=place_name,
+            address=raw.get('display_name'),
+            city=address.get('city') or address.get('town') or address.get('village'),
+            state=address.get('state'),
+            country=address.get('country'),
+            postal_code=address.get('postcode'),
+            place_type=self._classify_place_type(address),
+            raw_data=raw
+        )
+
+    def _add_to_cache(self, latitude: float, longitude: float, enrichment: PlaceEnrichment):
+        """Add an enrichment to the local cache, its spatial index and SQLite"""
+        cache_key = self._get_cache_key(latitude, longitude)
+        if cache_key not in self.cache:
+            self._index_add(cache_key, round(latitude, 4), round(longitude, 4))
+        self.cache[cache_key] = enrichment
+        self._store(latitude, longitude, enrichment)
+
+    def _remember(
+        self, latitude: float, longitude: float, raw: Dict, shared: bool = True
+    ) -> PlaceEnrichment:
+        """Parse a geocoding result and add it to the local (and, if shared, Redis) cache"""
+        enrichment = self._parse_result(raw)
+
+        self._add_to_cache(latitude, longitude, enrichment)
+        if shared:
+            self._set_shared(self._get_cache_key(latitude, longitude), enrichment)
+
+        logger.info(f"Enriched: {enrichment.name or enrichment.address}")
+        return enrichment
+
     def enrich_place(self, latitude: float, longitude: float, force: bool = False) -> Optional[PlaceEnrichment]:
         """
         Enrich a place with reverse geocoding
@@ -149,90 +582,238 @@ class PlaceEnricher:
         Returns:
             PlaceEnrichment object or None if geocoding fails
         """
-        cache_key = self._get_cache_key(latitude, longitude)
-
         # Check cache first (unless force=True)
         if not force:
-            # Exact cache match
-            if cache_key in self.cache:
-                logger.debug(f"Cache hit (exact): {cache_key}")
-                return self.cache[cache_key]
-
-            # Nearby cache match
-            nearby = self._find_cached_nearby(latitude, longitude)
-            if nearby:
-                logger.debug(f"Cache hit (nearby): {cache_key}")
-                # Store in cache at this location too
-                self.cache[cache_key] = nearby
-                return nearby
-
-        # Rate limiting
+            cached = self._get_cached(latitude, longitude)
+            if cached:
+                return cached
+
+        # Make API call
+        try:
+            logger.info(f"Reverse geocoding: {latitude:.6f}, {longitude:.6f}")
+            raw = self._reverse(latitude, longitude)
+
+            if not raw:
+                logger.warning(f"No result for {latitude}, {longitude}")
+                return None
+
+            return self._remember(latitude, longitude, raw)
+
+        except Exception as e:
+            logger.error(f"Geocoding failed for {latitude}, {longitude}: {e}")
+            return None
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Optional[Dict]:
+        """Decode a Nominatim reverse response (None when nothing was found)"""
+        response.raise_for_status()
+        raw = orjson.loads(response.content)
+        if not raw or 'error' in raw:
+            return None
+        return raw
+
+    def _reverse(self, latitude: float, longitude: float) -> Optional[Dict]:
+        """Call Nominatim's reverse endpoint over the persistent client (rate limited)"""
         time_since_last = time.time() - self.last_request_time
         if time_since_last < self.min_request_interval:
             sleep_time = self.min_request_interval - time_since_last
             logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
             time.sleep(sleep_time)
 
-        # Make API call
         try:
-            logger.info(f"Reverse geocoding: {latitude:.6f}, {longitude:.6f}")
-            location = self.geocoder.reverse(f"{latitude}, {longitude}", timeout=10)
+            response = self._http.get(
+                "/reverse",
+                params={"format": "jsonv2", "lat": latitude, "lon": longitude},
+            )
+        finally:
             self.last_request_time = time.time()
 
-            if not location:
-                logger.warning(f"No result for {latitude}, {longitude}")
-                return None
+        return self._parse_response(response)
+
+    async def _reverse_async(self, latitude: float, longitude: float) -> Optional[Dict]:
+        """
+        Call Nominatim's reverse endpoint without blocking the event loop
 
-            # Parse result
-            address = location.raw.get('address', {})
-
-            # Get place name - prioritize actual place names over addresses
-            place_name = location.raw.get('name', '')
-            if not place_name or place_name.isdigit():
-                # Fallback: check for business/poi name in address
-                place_name = (
-                    address.get('amenity') or
-                    address.get('shop') or
-                    address.get('building') or
-                    address.get('tourism') or
-                    location.raw.get('display_name', '').split(',')[0]
-                )
-
-            enrichment = PlaceEnrichment(
-                name=place_name,
-                address=location.address,
-                city=address.get('city') or address.get('town') or address.get('village'),
-                state=address.get('state'),
-                country=address.get('country'),
-                postal_code=address.get('postcode'),
-                place_type=self._classify_place_type(address),
-                raw_data=location.raw
+        Callers hold _request_lock, which serializes requests; they are spaced
+        at least min_request_interval apart and the wait is an asyncio.sleep,
+        so other coroutines keep running while a request is throttled.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=NOMINATIM_URL,
+                headers={"User-Agent": USER_AGENT},
+                timeout=10,
+                transport=httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS, retries=HTTP_RETRIES),
             )
 
-            # Cache the result
-            self.cache[cache_key] = enrichment
-            self.save_cache()
+        loop = asyncio.get_running_loop()
+        delay = self._next_request_at - loop.time()
+        if delay > 0:
+            logger.debug(f"Rate limiting: sleeping {delay:.2f}s")
+            await asyncio.sleep(delay)
 
-            logger.info(f"Enriched: {enrichment.name or enrichment.address}")
-            return enrichment
+        try:
+            response = await self._client.get(
+                "/reverse",
+                params={"format": "jsonv2", "lat": latitude, "lon": longitude},
+            )
+        finally:
+            self._next_request_at = loop.time() + self.min_request_interval
+
+        return self._parse_response(response)
+
+    async def _get_cached_async(
+        self, latitude: float, longitude: float
+    ) -> Optional[PlaceEnrichment]:
+        """Async variant of _get_cached (the Redis lookup does not block the event loop)"""
+        cached = self._get_cached(latitude, longitude, shared=False)
+        if cached:
+            return cached
+
+        cache_key = self._get_cache_key(latitude, longitude)
+        enrichment = await self._get_shared_async(cache_key)
+        if enrichment:
+            logger.debug(f"Cache hit (shared): {cache_key}")
+            self._add_to_cache(latitude, longitude, enrichment)
+        return enrichment
+
+    async def enrich_place_async(
+        self, latitude: float, longitude: float, force: bool = False
+    ) -> Optional[PlaceEnrichment]:
+        """
+        Async variant of enrich_place for use inside the event loop
+
+        Args:
+            latitude: Place latitude
+            longitude: Place longitude
+            force: If True, bypass cache and make API call
+
+        Returns:
+            PlaceEnrichment object or None if geocoding fails
+        """
+        enrichment, _ = await self.enrich_place_with_source_async(
+            latitude, longitude, force=force
+        )
+        return enrichment
+
+    async def enrich_place_with_source_async(
+        self, latitude: float, longitude: float, force: bool = False, shared: bool = True
+    ) -> Tuple[Optional[PlaceEnrichment], bool]:
+        """
+        Enrich a place, reporting whether the result came from the cache
+
+        The local cache is checked again once the request lock is held: while
+        this coroutine queued, the request ahead of it may have cached the
+        same point (or one within cache_radius), which is then a free hit.
+
+        Args:
+            latitude: Place latitude
+            longitude: Place longitude
+            force: If True, bypass cache and make API call
+            shared: If False, skip the Redis lookup (e.g. after prefetch)
+
+        Returns:
+            Tuple of (PlaceEnrichment or None, from_cache)
+        """
+        cache_key = self._get_cache_key(latitude, longitude)
+        if not force:
+            if shared:
+                cached = await self._get_cached_async(latitude, longitude)
+            else:
+                cached = self._get_cached(latitude, longitude, shared=False)
+            if cached:
+                return cached, True
+
+        try:
+            async with self._request_lock:
+                if not force:
+                    cached = self._get_cached(latitude, longitude, shared=False)
+                    if cached:
+                        return cached, True
+
+                logger.info(f"Reverse geocoding: {latitude:.6f}, {longitude:.6f}")
+                raw = await self._reverse_async(latitude, longitude)
+
+                if not raw:
+                    logger.warning(f"No result for {latitude}, {longitude}")
+                    return None, False
+
+                # Cached before the lock is released, so queued requests see it
+                enrichment = self._remember(latitude, longitude, raw, shared=False)
+
+            await self._set_shared_async(cache_key, enrichment)
+            return enrichment, False
 
         except Exception as e:
             logger.error(f"Geocoding failed for {latitude}, {longitude}: {e}")
-            return None
+            return None, False
+
+    async def enrich_places(
+        self, points: List[Tuple[float, float]], force: bool = False
+    ) -> List[Optional[PlaceEnrichment]]:
+        """
+        Enrich a batch of (latitude, longitude) points
+
+        Shared-cache entries are prefetched with one MGET, cache hits are
+        resolved immediately; only true misses wait on the rate-limited API,
+        and points sharing a cache key are geocoded once.
+
+        Args:
+            points: List of (latitude, longitude) tuples
+            force: If True, bypass cache and make API calls
+
+        Returns:
+            List of PlaceEnrichment (or None) in the same order as points
+        """
+        results: List[Optional[PlaceEnrichment]] = [None] * len(points)
+        misses: Dict[str, List[int]] = {}
+
+        if not force:
+            await self.prefetch_async(points)
+
+        for i, (latitude, longitude) in enumerate(points):
+            # Shared-cache entries were prefetched, so only the local cache is consulted here
+            cached = None if force else self._get_cached(latitude, longitude, shared=False)
+            if cached:
+                results[i] = cached
+            else:
+                misses.setdefault(self._get_cache_key(latitude, longitude), []).append(i)
+
+        if misses:
+            indices = list(misses.values())
+            # Misses were already looked up by the MGET, so skip the per-point Redis GET
+            enriched = await asyncio.gather(*(
+                self.enrich_place_with_source_async(*points[group[0]], force=force, shared=False)
+                for group in indices
+            ))
+            for group, (enrichment, _) in zip(indices, enriched):
+                for i in group:
+                    results[i] = enrichment
+
+        return results
+
+    async def aclose(self):
+        """Close the async HTTP and Redis clients"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._aredis is not None:
+            await self._aredis.aclose()
+            self._aredis = None
 
     def _classify_place_type(self, address: Dict) -> str:
         """Classify place type from address components"""
-        # Check for common place types in address
-        if 'amenity' in address:
-            return address['amenity']
-        elif 'shop' in address:
-            return 'commercial'
-        elif 'building' in address:
-            building = address['building']
-            if building in ['house', 'residential', 'apartments']:
-                return 'residence'
-            return 'building'
-        elif 'highway' in address:
+        # Check for common place types in address, in priority order
+        for component in PLACE_TYPE_PRIORITY:
+            value = address.get(component)
+            if value is None:
+                continue
+            if component == 'amenity':
+                return value
+            if component == 'shop':
+                return 'commercial'
+            if component == 'building':
+                return 'residence' if value in RESIDENTIAL_BUILDINGS else 'building'
             return 'road'
-        else:
-            return 'unknown'
+
+        return 'unknown'
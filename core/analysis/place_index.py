@@ -0,0 +1,85 @@
+"""
+Place Spatial Index
+File: core/analysis/place_index.py
+
+In-memory haversine BallTree over place centroids for radius queries.
+Built once at startup so nearby lookups don't scan the places table.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+import asyncpg
+import numpy as np
+from sklearn.neighbors import BallTree
+
+logger = logging.getLogger("myndy.place_index")
+
+EARTH_RADIUS_M = 6371000.0
+
+
+class PlaceIndex:
+    """
+    Spatial index of place ids by coordinates
+
+    Rebuild (via load) after places are created or moved; until then
+    queries reflect the places that existed when the index was built.
+    """
+
+    def __init__(self, ids: List[str], coords: np.ndarray):
+        """
+        Initialize place index
+
+        Args:
+            ids: Place ids (as strings)
+            coords: Array of shape (N, 2) with latitude/longitude in degrees
+        """
+        self.ids = ids
+        self._tree: Optional[BallTree] = (
+            BallTree(np.radians(coords), metric='haversine') if ids else None
+        )
+
+    @classmethod
+    async def load(cls, pool: asyncpg.Pool) -> "PlaceIndex":
+        """Build the index from all places in the database"""
+        async with pool.acquire() as conn:
+            rows = await conn.fetch("SELECT id::text, latitude, longitude FROM places")
+
+        ids = [row[0] for row in rows]
+        coords = np.array([(row[1], row[2]) for row in rows], dtype=np.float64).reshape(-1, 2)
+
+        logger.info(f"Built place index with {len(ids)} places")
+        return cls(ids, coords)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def query_radius(
+        self, latitude: float, longitude: float, radius_meters: float, limit: int
+    ) -> List[Tuple[str, float]]:
+        """
+        Find places within radius_meters of a point
+
+        Args:
+            latitude: Query latitude
+            longitude: Query longitude
+            radius_meters: Search radius in meters
+            limit: Maximum number of places to return
+
+        Returns:
+            List of (place_id, distance_meters), nearest first
+        """
+        if self._tree is None:
+            return []
+
+        idx, dist = self._tree.query_radius(
+            np.radians([[latitude, longitude]]),
+            r=radius_meters / EARTH_RADIUS_M,
+            return_distance=True,
+            sort_results=True,
+        )
+
+        return [
+            (self.ids[i], float(d) * EARTH_RADIUS_M)
+            for i, d in zip(idx[0][:limit], dist[0][:limit])
+        ]
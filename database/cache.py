@@ -0,0 +1,29 @@
+"""
+Redis Cache Client
+File: database/cache.py
+
+Shared async Redis client for short-lived response caching.
+"""
+
+import os
+import logging
+
+import redis.asyncio as redis
+from fastapi import Request
+
+logger = logging.getLogger(__name__)
+
+# Redis URL from environment
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+
+def create_redis() -> redis.Redis:
+    """Create the async Redis client (called from the app lifespan)"""
+    client = redis.from_url(REDIS_URL)
+    logger.info("✅ Redis client created")
+    return client
+
+
+def get_redis(request: Request) -> redis.Redis:
+    """Get the application's Redis client (dependency injection for FastAPI)"""
+    return request.app.state.redis
@@ -4,8 +4,8 @@
 -- Enable pgvector extension
 CREATE EXTENSION IF NOT EXISTS vector;
 
--- Enable PostGIS for advanced geographic queries (optional)
--- CREATE EXTENSION IF NOT EXISTS postgis;
+-- Enable PostGIS (geography columns + GIST radius indexes on places/location_data)
+CREATE EXTENSION IF NOT EXISTS postgis;
 
 -- Create indexes for performance
 -- Additional indexes will be created by Alembic migrations
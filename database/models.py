@@ -11,20 +11,39 @@ from sqlalchemy import (
     Float,
     Integer,
     Boolean,
+    Computed,
     DateTime,
     ForeignKey,
     Index,
     Text,
+    bindparam,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
+from geoalchemy2 import Geography
 import uuid
-from datetime import datetime
 
 from database.connection import Base
 
+# Geography point derived from the latitude/longitude columns (kept for plain reads)
+GEO_POINT_SQL = "ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography"
+
+# HNSW candidate list size for semantic search (recall vs. latency)
+HNSW_EF_SEARCH = 100
+
+# The ORDER BY must be the bare distance operator so the planner can use
+# idx_places_embedding; the similarity score is derived from it outside the sort
+SEMANTIC_SEARCH_QUERY = text("""
+    SELECT id, name, 1 - (embedding <=> :q) AS score
+    FROM places
+    WHERE embedding IS NOT NULL
+    ORDER BY embedding <=> :q
+    LIMIT :k
+""").bindparams(bindparam("q", type_=HALFVEC(384)))
+
 
 class LocationData(Base):
     """Raw GPS location points"""
@@ -35,18 +54,22 @@ class LocationData(Base):
     timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    geo = Column(
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+        Computed(GEO_POINT_SQL, persisted=True),
+    )
     accuracy = Column(Float)
     altitude = Column(Float)
     speed = Column(Float)
     course = Column(Float)
     source = Column(String(50))
     data = Column(JSONB)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     __table_args__ = (
         Index("idx_location_data_timestamp", "timestamp", postgresql_using="brin"),
-        Index("idx_location_data_coords", "latitude", "longitude"),
+        Index("idx_location_data_geo", "geo", postgresql_using="gist"),
     )
 
 
@@ -61,25 +84,70 @@ class Place(Base):
     place_type = Column(String(100))
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    geo = Column(
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+        Computed(GEO_POINT_SQL, persisted=True),
+    )
     radius_meters = Column(Float, default=50.0)
     address = Column(JSONB)
-    metadata = Column(JSONB)
+    place_metadata = Column(JSONB)  # "metadata" is reserved on declarative models
     visit_count = Column(Integer, default=0)
+    # Unnamed or placeholder-named places still waiting for reverse geocoding
+    needs_enrichment = Column(
+        Boolean,
+        Computed("name IS NULL OR name = '' OR name LIKE 'Place at%'", persisted=True),
+    )
     first_visit_at = Column(DateTime(timezone=True))
     last_visit_at = Column(DateTime(timezone=True))
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), onupdate=datetime.utcnow)
-    embedding = Column(Vector(384))  # Vector embedding for semantic search
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    embedding = Column(HALFVEC(384))  # fp16 vector embedding for semantic search
 
     # Relationships
     visits = relationship("Visit", back_populates="place")
     checkins = relationship("Checkin", back_populates="place")
 
     __table_args__ = (
-        Index("idx_places_coords", "latitude", "longitude"),
-        Index("idx_places_embedding", "embedding", postgresql_using="ivfflat"),
+        Index("idx_places_geo", "geo", postgresql_using="gist"),
+        # Serves ORDER BY visit_count DESC, last_visit_at DESC (enrichment priority)
+        Index(
+            "idx_places_visit_rank",
+            "visit_count",
+            "last_visit_at",
+            postgresql_ops={"visit_count": "DESC", "last_visit_at": "DESC"},
+        ),
+        Index(
+            "idx_places_needs_enrichment",
+            "visit_count",
+            "last_visit_at",
+            postgresql_ops={"visit_count": "DESC", "last_visit_at": "DESC"},
+            postgresql_where=text("needs_enrichment"),
+        ),
+        Index(
+            "idx_places_embedding",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
     )
 
+    @classmethod
+    def semantic_search(cls, session, qvec, k: int = 10):
+        """
+        Find the k places closest to a query embedding (cosine distance)
+
+        Args:
+            session: SQLAlchemy session
+            qvec: Query embedding (384 floats, bound as halfvec)
+            k: Number of places to return
+
+        Returns:
+            List of (id, name, score) rows, most similar first
+        """
+        session.execute(text(f"SET LOCAL hnsw.ef_search = {HNSW_EF_SEARCH}"))
+        return session.execute(SEMANTIC_SEARCH_QUERY, {"q": qvec, "k": k}).all()
+
 
 class Visit(Base):
     """Visit timeline - periods spent at places"""
@@ -102,8 +170,8 @@ class Visit(Base):
     departure_direction = Column(Float)
     is_drive_through = Column(Boolean, default=False)
 
-    metadata = Column(JSONB)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    visit_metadata = Column(JSONB)  # "metadata" is reserved on declarative models
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     place = relationship("Place", back_populates="visits")
@@ -133,7 +201,7 @@ class Movement(Base):
     avg_speed_ms = Column(Float)
     movement_type = Column(String(50))
     gps_track = Column(JSONB)  # Array of GPS points
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
         Index("idx_movements_start_time", "start_time", postgresql_using="brin"),
@@ -153,7 +221,7 @@ class Checkin(Base):
     longitude = Column(Float, nullable=False)
     notes = Column(Text)
     checked_in_at = Column(DateTime(timezone=True), nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     place = relationship("Place", back_populates="checkins")
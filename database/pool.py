@@ -0,0 +1,41 @@
+"""
+Async Database Pool
+File: database/pool.py
+
+asyncpg connection pool for request-path queries.
+SQLAlchemy (database/connection.py) remains in use for models and DDL.
+"""
+
+import logging
+
+import asyncpg
+from fastapi import Request
+
+from database.connection import DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+
+async def create_pool() -> asyncpg.Pool:
+    """Create the asyncpg connection pool (called from the app lifespan)"""
+    pool = await asyncpg.create_pool(
+        DATABASE_URL,
+        min_size=5,
+        max_size=20,
+        statement_cache_size=1024,
+    )
+    logger.info("✅ Database pool created")
+    return pool
+
+
+def get_pool(request: Request) -> asyncpg.Pool:
+    """
+    Get the application's asyncpg pool (dependency injection for FastAPI)
+
+    Usage:
+        from fastapi import Depends
+        async def my_endpoint(pool: asyncpg.Pool = Depends(get_pool)):
+            async with pool.acquire() as conn:
+                ...
+    """
+    return request.app.state.pool
@@ -9,6 +9,7 @@ Prioritizes high-visit-count places (home, work) first.
 
 import os
 import sys
+import asyncio
 import logging
 from pathlib import Path
 from datetime import datetime, timezone
@@ -17,7 +18,8 @@ from datetime import datetime, timezone
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+import psycopg2
+from psycopg2.extras import execute_values
 from core.analysis.enrichment import PlaceEnricher
 from core.analysis.classification import get_place_classifier
 from core.analysis.semantic_enrichment import get_semantic_enricher
@@ -27,6 +29,180 @@ import json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Places enriched concurrently (geocoding itself stays rate limited)
+MAX_CONCURRENCY = 10
+
+# Enriched places are written in batches: one UPDATE ... FROM (VALUES ...) per flush
+UPDATE_BATCH_SIZE = 20
+UPDATE_PLACES_SQL = """
+    UPDATE places
+    SET name = v.name,
+        address = v.address::jsonb,
+        place_type = v.place_type,
+        place_metadata = COALESCE(places.place_metadata, '{}'::jsonb) || v.metadata::jsonb,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (VALUES %s) AS v(id, name, address, place_type, metadata)
+    WHERE places.id = v.id::uuid
+"""
+
+
+def _execute_updates(conn, rows):
+    """Run UPDATE_PLACES_SQL for rows on conn's underlying DBAPI connection"""
+    with conn.connection.cursor() as cursor:
+        execute_values(cursor, UPDATE_PLACES_SQL, rows)
+
+
+def flush_updates(conn, pending):
+    """
+    Write pending place updates in a single statement (committed with conn's transaction)
+
+    The batch runs inside a SAVEPOINT; if it fails, each place is retried in
+    its own SAVEPOINT so one bad row doesn't discard the rest of the batch.
+
+    Returns:
+        Number of places that could not be written
+    """
+    if not pending:
+        return 0
+
+    failed = 0
+    try:
+        with conn.begin_nested():
+            _execute_updates(conn, pending)
+    except psycopg2.Error as e:
+        logger.warning(f"Batch update failed, retrying {len(pending)} places individually: {e}")
+        for row in pending:
+            try:
+                with conn.begin_nested():
+                    _execute_updates(conn, [row])
+            except psycopg2.Error as e:
+                failed += 1
+                logger.error(f"Failed to update place {row[0]}: {e}")
+
+    pending.clear()
+    return failed
+
+
+async def enrich_one(place, enricher, classifier, semantic_enricher, force=False):
+    """
+    Geocode, classify and semantically enrich a single place
+
+    Args:
+        place: Place dict with id, latitude, longitude and visit_count
+        enricher: PlaceEnricher instance
+        classifier: PlaceClassifier instance
+        semantic_enricher: Semantic enricher, or None when disabled
+        force: If True, bypass the enrichment cache
+
+    Returns:
+        Tuple of (status, output lines, update row or None) where status is
+        "cached", "geocoded" or "failed"
+    """
+    lines = []
+
+    # Shared-cache entries were prefetched, so only the local cache is consulted;
+    # it is re-checked under the rate-limit lock, so nearby places queued behind
+    # one geocode reuse its result instead of spending another API call
+    enrichment, from_cache = await enricher.enrich_place_with_source_async(
+        place['latitude'],
+        place['longitude'],
+        force=force,
+        shared=False
+    )
+
+    if not enrichment:
+        lines.append(f"   ❌ Failed to geocode")
+        return "failed", lines, None
+
+    if from_cache:
+        status = "cached"
+        lines.append(f"   ✅ From cache: {enrichment.name or enrichment.address}")
+    else:
+        status = "geocoded"
+        lines.append(f"   ✅ Geocoded: {enrichment.name or enrichment.address}")
+
+    # Enhanced classification using PlaceClassifier
+    classified_type = classifier.classify_place(
+        name=enrichment.name,
+        place_type=enrichment.place_type,
+        metadata={'raw_data': enrichment.raw_data} if hasattr(enrichment, 'raw_data') else None
+    )
+
+    # Log if classification improved the type
+    if classified_type != (enrichment.place_type or 'unknown'):
+        lines.append(f"   🏷️  Improved classification: {enrichment.place_type or 'unknown'} → {classified_type}")
+
+    # Semantic enrichment with Claude API (blocking client, so run it off the loop)
+    semantic_data = None
+    if semantic_enricher and enrichment.name:
+        try:
+            semantic_data = await asyncio.to_thread(
+                semantic_enricher.enrich_place,
+                name=enrichment.name,
+                place_type=classified_type,
+                coordinates=(place['latitude'], place['longitude']),
+                address=enrichment.address,
+                city=enrichment.city,
+                visit_stats={
+                    'visit_count': place['visit_count']
+                }
+            )
+            if semantic_data:
+                lines.append(f"   ✨ Semantic: {semantic_data.get('description', '')[:60]}...")
+        except Exception as e:
+            logger.warning(f"Semantic enrichment failed for {enrichment.name}: {e}")
+
+    # Build address JSONB
+    address_data = {}
+    if enrichment.address:
+        address_data['full_address'] = enrichment.address
+    if enrichment.city:
+        address_data['city'] = enrichment.city
+    if enrichment.state:
+        address_data['state'] = enrichment.state
+    if enrichment.country:
+        address_data['country'] = enrichment.country
+    if enrichment.postal_code:
+        address_data['postal_code'] = enrichment.postal_code
+
+    # Build place_metadata JSONB (preserve existing metadata)
+    metadata = {}
+    if semantic_data:
+        metadata['semantic'] = semantic_data
+    metadata['enriched_at'] = datetime.now(timezone.utc).isoformat()
+    metadata['enrichment_source'] = 'reverse_geocoding'
+
+    update = (
+        place['id'],
+        enrichment.name,
+        json.dumps(address_data) if address_data else None,
+        classified_type,  # Use enhanced classification
+        json.dumps(metadata),
+    )
+    return status, lines, update
+
+
+async def enrich_all(places, enricher, classifier, semantic_enricher, force=False):
+    """
+    Enrich places concurrently, at most MAX_CONCURRENCY in flight
+
+    Nominatim requests are still spaced by the enricher's rate limit; the
+    concurrency overlaps cache lookups and semantic enrichment calls.
+
+    Returns:
+        List of enrich_one results in the same order as places
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def _enrich(place):
+        async with sem:
+            return await enrich_one(place, enricher, classifier, semantic_enricher, force=force)
+
+    try:
+        return await asyncio.gather(*(_enrich(place) for place in places))
+    finally:
+        await enricher.aclose()
+
 
 def main():
     import argparse
@@ -58,9 +234,13 @@ def main():
         print("❌ ERROR: DATABASE_URL environment variable not set")
         sys.exit(1)
 
-    engine = create_engine(database_url)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    engine = create_engine(
+        database_url,
+        pool_size=5,
+        max_overflow=5,
+        pool_pre_ping=True,
+        pool_recycle=300,
+    )
 
     print(f"🏷️  Place Enrichment (Cost-Optimized)\n")
     print("=" * 60)
@@ -78,42 +258,44 @@ def main():
             FROM places
             WHERE visit_count >= :min_visits
             ORDER BY visit_count DESC, last_visit_at DESC
+            LIMIT :max_calls
         """
     else:
         # Only places without names or coordinate-based names
         query = """
             SELECT id, latitude, longitude, name, visit_count
             FROM places
-            WHERE (name IS NULL OR name = '' OR name LIKE 'Place at%')
+            WHERE needs_enrichment
               AND visit_count >= :min_visits
             ORDER BY visit_count DESC, last_visit_at DESC
+            LIMIT :max_calls
         """
 
-    result = session.execute(text(query), {"min_visits": args.min_visits})
-    places_to_enrich = []
-
-    for row in result:
-        places_to_enrich.append({
-            'id': str(row[0]),
-            'latitude': float(row[1]),
-            'longitude': float(row[2]),
-            'name': row[3],
-            'visit_count': row[4]
-        })
+    # Top max_calls places by visit count (read in order from idx_places_visit_rank /
+    # idx_places_needs_enrichment rather than sorting the table)
+    with engine.connect() as conn:
+        result = conn.execute(
+            text(query), {"min_visits": args.min_visits, "max_calls": args.max_calls}
+        )
+        places_to_enrich = []
+
+        for row in result:
+            places_to_enrich.append({
+                'id': str(row[0]),
+                'latitude': float(row[1]),
+                'longitude': float(row[2]),
+                'name': row[3],
+                'visit_count': row[4]
+            })
 
-    print(f"✅ Found {len(places_to_enrich)} places needing enrichment")
+    print(f"✅ Selected {len(places_to_enrich)} places needing enrichment (top by visit count)")
 
     if not places_to_enrich:
         print("\n✅ All places are already enriched!")
         print("💡 Use --force to re-enrich all places")
-        session.close()
+        engine.dispose()
         return
 
-    # Limit to max calls
-    if len(places_to_enrich) > args.max_calls:
-        print(f"⚠️  Limiting to top {args.max_calls} places (sorted by visit count)")
-        places_to_enrich = places_to_enrich[:args.max_calls]
-
     # Initialize enricher, classifier, and semantic enricher
     enricher = PlaceEnricher(
         cache_file="data/place_enrichment_cache.json",
@@ -131,106 +313,48 @@ def main():
 
     print(f"\n📍 Enriching {len(places_to_enrich)} places...\n")
 
+    # One MGET for every candidate instead of a Redis round-trip per place
+    if not args.force:
+        prefetched = enricher.prefetch([(p['latitude'], p['longitude']) for p in places_to_enrich])
+        if prefetched:
+            print(f"♻️  Prefetched {prefetched} enrichments from shared cache")
+
+    results = asyncio.run(enrich_all(
+        places_to_enrich,
+        enricher,
+        classifier,
+        semantic_enricher if semantic_enabled else None,
+        force=args.force,
+    ))
+
     enriched_count = 0
     cached_count = 0
     failed_count = 0
-
-    for i, place in enumerate(places_to_enrich, 1):
-        print(f"{i}/{len(places_to_enrich)}: {place['latitude']:.6f}, {place['longitude']:.6f}")
-        print(f"   Visits: {place['visit_count']}")
-
-        # Enrich place
-        enrichment = enricher.enrich_place(
-            place['latitude'],
-            place['longitude'],
-            force=args.force
-        )
-
-        if enrichment:
-            # Check if it was from cache
-            cache_key = enricher._get_cache_key(place['latitude'], place['longitude'])
-            from_cache = cache_key in enricher.cache and not args.force
-
-            if from_cache:
+    write_failed_count = 0
+    pending_updates = []
+
+    # All writes share one connection and commit once at the end
+    with engine.begin() as conn:
+        for i, (place, (status, lines, update)) in enumerate(zip(places_to_enrich, results), 1):
+            print(f"{i}/{len(places_to_enrich)}: {place['latitude']:.6f}, {place['longitude']:.6f}")
+            print(f"   Visits: {place['visit_count']}")
+            for line in lines:
+                print(line)
+            print()
+
+            if status == "cached":
                 cached_count += 1
-                print(f"   ✅ From cache: {enrichment.name or enrichment.address}")
-            else:
+            elif status == "geocoded":
                 enriched_count += 1
-                print(f"   ✅ Geocoded: {enrichment.name or enrichment.address}")
-
-            # Enhanced classification using PlaceClassifier
-            classified_type = classifier.classify_place(
-                name=enrichment.name,
-                place_type=enrichment.place_type,
-                metadata={'raw_data': enrichment.raw_data} if hasattr(enrichment, 'raw_data') else None
-            )
-
-            # Log if classification improved the type
-            if classified_type != (enrichment.place_type or 'unknown'):
-                print(f"   🏷️  Improved classification: {enrichment.place_type or 'unknown'} → {classified_type}")
-
-            # Semantic enrichment with Claude API
-            semantic_data = None
-            if semantic_enabled and enrichment.name:
-                try:
-                    semantic_data = semantic_enricher.enrich_place(
-                        name=enrichment.name,
-                        place_type=classified_type,
-                        coordinates=(place['latitude'], place['longitude']),
-                        address=enrichment.address,
-                        city=enrichment.city,
-                        visit_stats={
-                            'visit_count': place['visit_count']
-                        }
-                    )
-                    if semantic_data:
-                        print(f"   ✨ Semantic: {semantic_data.get('description', '')[:60]}...")
-                except Exception as e:
-                    logger.warning(f"Semantic enrichment failed for {enrichment.name}: {e}")
-
-            # Build address JSONB
-            address_data = {}
-            if enrichment.address:
-                address_data['full_address'] = enrichment.address
-            if enrichment.city:
-                address_data['city'] = enrichment.city
-            if enrichment.state:
-                address_data['state'] = enrichment.state
-            if enrichment.country:
-                address_data['country'] = enrichment.country
-            if enrichment.postal_code:
-                address_data['postal_code'] = enrichment.postal_code
-
-            # Build place_metadata JSONB (preserve existing metadata)
-            metadata = {}
-            if semantic_data:
-                metadata['semantic'] = semantic_data
-            metadata['enriched_at'] = datetime.now(timezone.utc).isoformat()
-            metadata['enrichment_source'] = 'reverse_geocoding'
-
-            # Update database
-            session.execute(text("""
-                UPDATE places
-                SET name = :name,
-                    address = :address,
-                    place_type = :place_type,
-                    place_metadata = COALESCE(place_metadata, '{}'::jsonb) || CAST(:metadata AS jsonb),
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = :id
-            """), {
-                'id': place['id'],
-                'name': enrichment.name,
-                'address': json.dumps(address_data) if address_data else None,
-                'place_type': classified_type,  # Use enhanced classification
-                'metadata': json.dumps(metadata)
-            })
+            else:
+                failed_count += 1
 
-            session.commit()
-        else:
-            failed_count += 1
-            print(f"   ❌ Failed to geocode")
+            if update:
+                pending_updates.append(update)
+                if len(pending_updates) >= UPDATE_BATCH_SIZE:
+                    write_failed_count += flush_updates(conn, pending_updates)
 
-        print()
+        write_failed_count += flush_updates(conn, pending_updates)
 
     # Summary
     print("=" * 60)
@@ -239,51 +363,61 @@ def main():
     print(f"New API calls: {enriched_count} 💰")
     print(f"From cache: {cached_count} (free!)")
     print(f"Failed: {failed_count}")
+    if write_failed_count:
+        print(f"Database update failed: {write_failed_count}")
     print(f"\nCache size: {len(enricher.cache)} locations")
 
     if enriched_count > 0:
         print(f"\n💰 API calls used: {enriched_count}/{args.max_calls}")
 
     # Show top enriched places
-    print("\n🏆 Top Enriched Places:\n")
-    result = session.execute(text("""
-        SELECT name, address, visit_count, last_visit_at
-        FROM places
-        WHERE name IS NOT NULL AND name NOT LIKE 'Place at%'
-        ORDER BY visit_count DESC, last_visit_at DESC
-        LIMIT 10
-    """))
-
-    for i, row in enumerate(result, 1):
-        name = row[0]
-        address_json = row[1]
-        visits = row[2]
-        last_visit = row[3]
-
-        # Extract city/state from address JSONB
-        location = "Unknown"
-        if address_json:
-            try:
-                address_data = json.loads(address_json) if isinstance(address_json, str) else address_json
-                city = address_data.get("city")
-                state = address_data.get("state")
-                location = f"{city}, {state}" if city and state else (city or state or "Unknown")
-            except:
-                location = "Unknown"
-
-        print(f"{i}. {name}")
-        print(f"   Location: {location}")
-        print(f"   Visits: {visits} | Last visit: {last_visit.strftime('%Y-%m-%d') if last_visit else 'Unknown'}")
-        print()
-
-    print("✅ Enrichment complete!")
-
-    if len(places_to_enrich) < len(result.fetchall()) and not args.force:
-        remaining = len(result.fetchall()) - len(places_to_enrich)
-        print(f"\n💡 {remaining} more places need enrichment")
-        print(f"   Run again to enrich {min(remaining, args.max_calls)} more")
-
-    session.close()
+    with engine.connect() as conn:
+        print("\n🏆 Top Enriched Places:\n")
+        result = conn.execute(text("""
+            SELECT name, address, visit_count, last_visit_at
+            FROM places
+            WHERE NOT needs_enrichment
+            ORDER BY visit_count DESC, last_visit_at DESC
+            LIMIT 10
+        """))
+
+        for i, row in enumerate(result, 1):
+            name = row[0]
+            address_json = row[1]
+            visits = row[2]
+            last_visit = row[3]
+
+            # Extract city/state from address JSONB
+            location = "Unknown"
+            if address_json:
+                try:
+                    address_data = json.loads(address_json) if isinstance(address_json, str) else address_json
+                    city = address_data.get("city")
+                    state = address_data.get("state")
+                    location = f"{city}, {state}" if city and state else (city or state or "Unknown")
+                except:
+                    location = "Unknown"
+
+            print(f"{i}. {name}")
+            print(f"   Location: {location}")
+            print(f"   Visits: {visits} | Last visit: {last_visit.strftime('%Y-%m-%d') if last_visit else 'Unknown'}")
+            print()
+
+        print("✅ Enrichment complete!")
+
+        if not args.force:
+            remaining = conn.execute(text("""
+                SELECT COUNT(*)
+                FROM places
+                WHERE needs_enrichment
+                  AND visit_count >= :min_visits
+            """), {"min_visits": args.min_visits}).scalar()
+            if remaining:
+                print(f"\n💡 {remaining} more places need enrichment")
+                print(f"   Run again to enrich {min(remaining, args.max_calls)} more")
+
+    enricher.close()
+    engine.dispose()
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ File: scripts/migrate_from_myndy_ai.py
 Migrates existing location data from myndy-ai postgres to myndy-location postgres.
 
 Usage:
-    python scripts/migrate_from_myndy_ai.py --dry-run
+    python scripts/migrate_from_myndy_ai.py --dry-run [--exact]
     python scripts/migrate_from_myndy_ai.py --migrate
 """
 
@@ -14,11 +14,11 @@ import argparse
 import logging
 import os
 import sys
+import threading
 from datetime import datetime
 from typing import Dict, Any
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -28,20 +28,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Binary COPY between the two databases. The source columns are cast to the
+# target column types, since binary COPY requires the types to match exactly.
+COPY_OUT_LOCATION_DATA_SQL = """
+    COPY (
+        SELECT id::uuid, timestamp::timestamptz, latitude::float8, longitude::float8,
+               accuracy::float8, altitude::float8,
+               NULL::float8,  -- speed (not in old schema)
+               NULL::float8,  -- course (not in old schema)
+               source::text, data::jsonb, created_at::timestamptz, updated_at::timestamptz
+        FROM location_data
+    ) TO STDOUT WITH (FORMAT BINARY)
+"""
+
+COPY_IN_LOCATION_DATA_SQL = """
+    COPY location_data_stage
+        (id, timestamp, latitude, longitude, accuracy, altitude,
+         speed, course, source, data, created_at, updated_at)
+    FROM STDIN WITH (FORMAT BINARY)
+"""
+
+# Planner row estimate: O(1) instead of a full scan, -1 if never analyzed
+# (no row when the table does not exist)
+FAST_COUNT_SQL = """
+    SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)
+"""
+
+
+def _fast_count(cur, table: str) -> int:
+    """
+    Estimated row count for a table from pg_class.reltuples
+
+    Tables that have never been analyzed are analyzed first so the
+    estimate is populated.
+    """
+    cur.execute(FAST_COUNT_SQL, (table,))
+    row = cur.fetchone()
+    if row is None:
+        return 0
+    if row[0] < 0:
+        cur.execute(f"ANALYZE {table}")
+        cur.execute(FAST_COUNT_SQL, (table,))
+        row = cur.fetchone()
+    return max(row[0], 0)
+
 
 class LocationDataMigrator:
     """Migrates location data from myndy-ai to myndy-location"""
 
-    def __init__(self, source_url: str, target_url: str):
+    def __init__(self, source_url: str, target_url: str, exact: bool = False):
         """
         Initialize migrator
 
         Args:
             source_url: Connection URL for myndy-ai postgres
             target_url: Connection URL for myndy-location postgres
+            exact: Count rows with COUNT(*) instead of planner estimates
         """
         self.source_url = source_url
         self.target_url = target_url
+        self.exact = exact
+
+    def _count(self, cur, table: str) -> int:
+        """Row count for a table (estimated unless exact counts were requested)"""
+        if not self.exact:
+            return _fast_count(cur, table)
+
+        cur.execute(f"SELECT COUNT(*) FROM {table};")
+        return cur.fetchone()[0]
 
     def get_source_counts(self) -> Dict[str, int]:
         """Get counts from source database"""
@@ -52,27 +106,23 @@ class LocationDataMigrator:
                 counts = {}
 
                 # Count GPS points
-                cur.execute("SELECT COUNT(*) FROM location_data;")
-                counts["location_data"] = cur.fetchone()[0]
+                counts["location_data"] = self._count(cur, "location_data")
 
                 # Count places
                 try:
-                    cur.execute("SELECT COUNT(*) FROM places;")
-                    counts["places"] = cur.fetchone()[0]
+                    counts["places"] = self._count(cur, "places")
                 except:
                     counts["places"] = 0
 
                 # Count visits
                 try:
-                    cur.execute("SELECT COUNT(*) FROM visits;")
-                    counts["visits"] = cur.fetchone()[0]
+                    counts["visits"] = self._count(cur, "visits")
                 except:
                     counts["visits"] = 0
 
                 # Count movements
                 try:
-                    cur.execute("SELECT COUNT(*) FROM movements;")
-                    counts["movements"] = cur.fetchone()[0]
+                    counts["movements"] = self._count(cur, "movements")
                 except:
                     counts["movements"] = 0
 
@@ -91,20 +141,16 @@ class LocationDataMigrator:
                 counts = {}
 
                 # Count GPS points
-                cur.execute("SELECT COUNT(*) FROM location_data;")
-                counts["location_data"] = cur.fetchone()[0]
+                counts["location_data"] = self._count(cur, "location_data")
 
                 # Count places
-                cur.execute("SELECT COUNT(*) FROM places;")
-                counts["places"] = cur.fetchone()[0]
+                counts["places"] = self._count(cur, "places")
 
                 # Count visits
-                cur.execute("SELECT COUNT(*) FROM visits;")
-                counts["visits"] = cur.fetchone()[0]
+                counts["visits"] = self._count(cur, "visits")
 
                 # Count movements
-                cur.execute("SELECT COUNT(*) FROM movements;")
-                counts["movements"] = cur.fetchone()[0]
+                counts["movements"] = self._count(cur, "movements")
 
         logger.info(f"✅ Target database counts:")
         for table, count in counts.items():
@@ -112,85 +158,77 @@ class LocationDataMigrator:
 
         return counts
 
-    def migrate_location_data(self, batch_size: int = 1000) -> int:
+    def migrate_location_data(self) -> int:
         """
         Migrate GPS location data
 
-        Args:
-            batch_size: Number of records to migrate at once
+        Pipes a binary COPY out of the source straight into a COPY into a
+        staging table on the target, so rows never become Python objects,
+        then moves them into location_data with ON CONFLICT DO NOTHING.
 
         Returns:
             Number of records migrated
         """
         logger.info("🔄 Migrating location_data (GPS points)...")
 
-        migrated = 0
-
         with psycopg2.connect(self.source_url) as source_conn:
             with psycopg2.connect(self.target_url) as target_conn:
-                source_cur = source_conn.cursor(cursor_factory=RealDictCursor)
+                source_cur = source_conn.cursor()
                 target_cur = target_conn.cursor()
 
-                # Query source data
-                source_cur.execute(
+                # The load is re-runnable (ON CONFLICT DO NOTHING), so don't wait on the WAL flush
+                target_cur.execute("SET LOCAL synchronous_commit = off")
+
+                # Staging table keeps ON CONFLICT semantics (COPY can't skip duplicates).
+                # Temp tables are never WAL-logged, so only the final merge writes WAL.
+                target_cur.execute(
                     """
+                    CREATE TEMP TABLE location_data_stage
+                        (LIKE location_data INCLUDING DEFAULTS) ON COMMIT DROP
+                """
+                )
+
+                read_fd, write_fd = os.pipe()
+                reader = os.fdopen(read_fd, "rb")
+                export_errors = []
+
+                def export():
+                    try:
+                        with os.fdopen(write_fd, "wb") as writer:
+                            source_cur.copy_expert(COPY_OUT_LOCATION_DATA_SQL, writer)
+                    except Exception as e:
+                        export_errors.append(e)
+
+                exporter = threading.Thread(target=export, daemon=True)
+                exporter.start()
+                try:
+                    target_cur.copy_expert(COPY_IN_LOCATION_DATA_SQL, reader)
+                finally:
+                    # Closing the read end unblocks the exporter if the import failed
+                    # (its resulting pipe error is a consequence, so the import error wins)
+                    reader.close()
+                    exporter.join()
+
+                if export_errors:
+                    raise export_errors[0]
+
+                logger.info("   Copied source rows to staging, merging...")
+                target_cur.execute(
+                    """
+                    INSERT INTO location_data
+                        (id, timestamp, latitude, longitude, accuracy, altitude,
+                         speed, course, source, data, created_at, updated_at)
                     SELECT id, timestamp, latitude, longitude, accuracy, altitude,
-                           source, data, created_at, updated_at
-                    FROM location_data
-                    ORDER BY timestamp
+                           speed, course, source, data, created_at, updated_at
+                    FROM location_data_stage
+                    ON CONFLICT (id) DO NOTHING
                 """
                 )
+                migrated = target_cur.rowcount
 
-                batch = []
-                for row in source_cur:
-                    batch.append(
-                        (
-                            row["id"],
-                            row["timestamp"],
-                            row["latitude"],
-                            row["longitude"],
-                            row["accuracy"],
-                            row["altitude"],
-                            None,  # speed (not in old schema)
-                            None,  # course (not in old schema)
-                            row["source"],
-                            row["data"],
-                            row["created_at"],
-                            row["updated_at"],
-                        )
-                    )
-
-                    if len(batch) >= batch_size:
-                        # Insert batch
-                        target_cur.executemany(
-                            """
-                            INSERT INTO location_data
-                                (id, timestamp, latitude, longitude, accuracy, altitude,
-                                 speed, course, source, data, created_at, updated_at)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (id) DO NOTHING
-                        """,
-                            batch,
-                        )
-                        target_conn.commit()
-                        migrated += len(batch)
-                        logger.info(f"   Migrated {migrated:,} GPS points...")
-                        batch = []
-
-                # Insert remaining batch
-                if batch:
-                    target_cur.executemany(
-                        """
-                        INSERT INTO location_data
-                            (id, timestamp, latitude, longitude, accuracy, altitude,
-                             speed, course, source, data, created_at, updated_at)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (id) DO NOTHING
-                    """,
-                        batch,
-                    )
-                    target_conn.commit()
-                    migrated += len(batch)
+                # Refresh planner stats (and the reltuples estimate) after the bulk load
+                target_cur.execute("ANALYZE location_data")
+                target_conn.commit()
 
         logger.info(f"✅ Migrated {migrated:,} GPS points")
         return migrated
@@ -249,6 +287,11 @@ def main():
         "--dry-run", action="store_true", help="Show counts without migrating"
     )
     parser.add_argument("--migrate", action="store_true", help="Run migration")
+    parser.add_argument(
+        "--exact",
+        action="store_true",
+        help="Exact COUNT(*) row counts instead of planner estimates (slow on large tables)",
+    )
     parser.add_argument(
         "--source",
         default=os.getenv(
@@ -273,7 +316,7 @@ def main():
         sys.exit(1)
 
     # Create migrator
-    migrator = LocationDataMigrator(args.source, args.target)
+    migrator = LocationDataMigrator(args.source, args.target, exact=args.exact)
 
     if args.dry_run:
         logger.info("🔍 Dry run mode - showing counts only")
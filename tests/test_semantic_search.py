@@ -0,0 +1,92 @@
+"""
+Semantic Search Index Tests
+File: tests/test_semantic_search.py
+
+Integration tests against a live PostgreSQL + pgvector database (DATABASE_URL).
+Rows are inserted in a transaction that is rolled back, so the database is left unchanged.
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pgvector")
+pytest.importorskip("geoalchemy2")
+
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.orm import Session
+from pgvector.sqlalchemy import HALFVEC
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="DATABASE_URL not set")
+
+DIMENSIONS = 384
+SAMPLE_ROWS = 50
+
+
+def _random_embedding(rng: random.Random):
+    return [rng.uniform(-1.0, 1.0) for _ in range(DIMENSIONS)]
+
+
+@pytest.fixture
+def conn():
+    """Connection inside a transaction with sample places, rolled back afterwards"""
+    engine = create_engine(DATABASE_URL)
+    with engine.connect() as connection:
+        trans = connection.begin()
+        if connection.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'vector'")).first() is None:
+            pytest.skip("pgvector extension not installed")
+        if connection.execute(text("SELECT to_regclass('idx_places_embedding')")).scalar() is None:
+            pytest.skip("idx_places_embedding missing (run alembic upgrade head)")
+
+        rng = random.Random(42)
+        insert = text("""
+            INSERT INTO places (id, name, latitude, longitude, embedding)
+            VALUES (gen_random_uuid(), :name, 0, 0, :embedding)
+        """).bindparams(bindparam("embedding", type_=HALFVEC(DIMENSIONS)))
+        connection.execute(insert, [
+            {"name": f"Semantic test {i}", "embedding": _random_embedding(rng)}
+            for i in range(SAMPLE_ROWS)
+        ])
+
+        try:
+            yield connection
+        finally:
+            trans.rollback()
+    engine.dispose()
+
+
+def test_semantic_search_uses_embedding_index(conn):
+    """ORDER BY must stay the bare distance operator so the HNSW index is usable"""
+    from database.models import SEMANTIC_SEARCH_QUERY
+
+    conn.execute(text("SET LOCAL enable_seqscan = off"))
+    explain = text("EXPLAIN " + SEMANTIC_SEARCH_QUERY.text).bindparams(
+        bindparam("q", type_=HALFVEC(DIMENSIONS))
+    )
+    plan = "\n".join(
+        row[0]
+        for row in conn.execute(explain, {"q": _random_embedding(random.Random(7)), "k": 5})
+    )
+
+    assert "Index Scan using idx_places_embedding" in plan, plan
+
+
+def test_semantic_search_returns_most_similar_first(conn):
+    """Results come back ordered by similarity score"""
+    from database.models import Place
+
+    with Session(bind=conn) as session:
+        rows = Place.semantic_search(session, _random_embedding(random.Random(7)), k=5)
+
+    assert len(rows) == 5
+    scores = [row.score for row in rows]
+    assert scores == sorted(scores, reverse=True)